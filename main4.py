@@ -1,17 +1,7 @@
-from src.simulation.data_simulation4 import simulate_all_modes
-from datetime import datetime, timezone
-import logging
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+from run import run
 
 def main4() -> None:
-    start_date = datetime.now(timezone.utc)
-    logger.info("Starting full data simulation…")
-    simulate_all_modes()
-    logger.info("Data simulation complete!")
-    end_date = datetime.now(timezone.utc)
-    logger.info(f"Simulation ran for: {(end_date - start_date).total_seconds() / 60} minutes")
+    run("4")
 
 if __name__ == "__main__":
     main4()
\ No newline at end of file
@@ -0,0 +1,69 @@
+import argparse
+import faulthandler
+import importlib
+import logging
+import logging.handlers
+import queue
+import sys
+import time
+
+# The log format uses none of the thread/process fields, so skip collecting them for every record.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.raiseExceptions = False
+
+# Simulation module for each config variant. Only the chosen one gets imported.
+MODES = {
+    "all": "src.simulation.data_simulation", # Every game mode from src/config.py
+    "1": "src.simulation.data_simulation1",
+    "2": "src.simulation.data_simulation2",
+    "3": "src.simulation.data_simulation3",
+    "4": "src.simulation.data_simulation4",
+    "5": "src.simulation.data_simulation5",
+    "6": "src.simulation.data_simulation6",
+}
+
+logger = logging.getLogger(__name__)
+
+def configure_logging() -> logging.handlers.QueueListener:
+    # Log records are queued on the simulation thread and written to stderr by a background listener thread.
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    logging.Formatter.converter = time.gmtime # asctime in UTC, like every timestamp the simulation stores
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s " + logging.BASIC_FORMAT))
+    # force=True drops any handler an earlier import attached, so every record is emitted exactly once.
+    # The queue handler only merges the message args; the stream handler does the real formatting.
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[logging.handlers.QueueHandler(log_queue)], force=True)
+    logging.captureWarnings(True)
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+def log_unraisable(unraisable) -> None:
+    # Exceptions Python cannot raise (e.g. from __del__) go through the log queue instead of straight to stderr.
+    logger.error("Unraisable exception in %r", unraisable.object, exc_info=(unraisable.exc_type, unraisable.exc_value, unraisable.exc_traceback))
+
+def run(mode: str) -> None:
+    faulthandler.enable() # Hard crashes (segfaults, aborts) still dump the Python stack of every thread
+    listener = configure_logging() # Before the import, so the simulation module's own basicConfig is a no-op
+    sys.unraisablehook = log_unraisable
+    try:
+        module = importlib.import_module(MODES[mode]) # Import-time setup (DB session, tables) stays out of the timed region below
+
+        start_ns = time.perf_counter_ns() # Monotonic; wall-clock stamps come from the formatter's asctime
+        logger.debug("Starting full data simulation…")
+        module.simulate_all_modes()
+        end_ns = time.perf_counter_ns() # Read once, before any logging work lands inside the measured interval
+        logger.info("Data simulation complete! Ran for: %.3f minutes (start=%d end=%d)", (end_ns - start_ns) / 60_000_000_000, start_ns, end_ns)
+    except BaseException:
+        logger.exception("Data simulation failed")
+        raise
+    finally:
+        listener.stop() # Flushes the queue, so the traceback above is written before the process exits
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the matchmaking data simulation for one config variant.")
+    parser.add_argument("--mode", choices=MODES, default="all", help="'all' runs src/config.py, a number N runs src/configN.py")
+    args = parser.parse_args()
+    run(args.mode)
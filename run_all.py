@@ -0,0 +1,25 @@
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from run import MODES, run
+
+# Each mode writes to its own tables, so the simulations are independent and run in separate worker processes.
+# run() is called inside the worker, so every process sets up its own log listener thread.
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    # fork starts each worker from a copy of this process instead of re-running this script, as spawn would.
+    # The parent only imports run, not config or a simulation module (those open a DB session at import), so each worker imports them itself.
+    try:
+        multiprocessing.set_start_method("fork")
+    except (RuntimeError, ValueError): # Already set, or fork is not available on this platform (Windows)
+        pass
+    parser = argparse.ArgumentParser(description="Run several config variants of the data simulation in parallel.")
+    parser.add_argument("modes", nargs="*", choices=MODES, help="Modes to run (default: every numbered mode, 1-6)")
+    args = parser.parse_args()
+    # "all" already runs every game mode one after another, so next to the numbered modes it would only repeat their work
+    if "all" in args.modes and len(args.modes) > 1:
+        parser.error("'all' cannot be combined with other modes")
+    modes = args.modes or [mode for mode in MODES if mode != "all"]
+    with ProcessPoolExecutor(max_workers=len(modes)) as executor:
+        list(executor.map(run, modes))
@@ -1,47 +1,296 @@
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
 from datetime import datetime, timedelta, timezone
-from elote import EloCompetitor, GlickoCompetitor
+import numpy as np
 
+__all__ = [
+    'VP_FEATURES', 'VP_SIGNS', 'RANK_DELTA_FEATURES', 'VPFeature', 'RankDeltaFeature', 'SKILL_TIERS', 'SKILL_IDX', 'ADJ_FEATURES', 'ADJ_KEYS', 'ADJ_KEY_IDX', 'ZERO_EXCLUDE_KEYS', 'ZERO_EXCLUDE_MASK', 'ZERO_EXCLUDE_INDICES',
+    'BASE_PERFORMANCE', 'GameMode', 'GAME_TYPE_NAMES', 'GAME_MODES', 'GAME_TYPES', 'get_game_mode',
+    'interpolate_stat', 'interpolate_rows', 'interpolate_rows_batch', 'interpolate_stats', 'get_stat_vector', 'get_stat_parameters', 'get_stat_parameters_batch', 'ensure_utc', 'roundInt',
+    'STAT_ATTRS', 'TOTAL_ATTRIBUTES', 'RANK_AVERAGES', 'RANK_DISTRIBUTION_WEIGHTS', 'RANK_BUCKET_COUNT',
+    'TOTAL_ATTR_NAMES', 'TOTAL_ATTR_SIGNS', 'RANK_AVG_NAMES', 'RANK_AVG_SIGNS',
+    'TOTAL_PLAYERS', 'DISTRIBUTION_COUNT', 'DISTRIBUTION', 'SCENARIO_PLAYER_PARTIES',
+    'REF_INITIAL_TRUE_RATING', 'REFERENCE_PLAYER_COUNT', 'REF_COEF_AND_GAMES',
+    'GLOBAL_START_TIME', 'ONE_WEEK', 'ONE_YEAR', 'HALF_MINUTE', 'GAME_GAP',
+    'ELO_K_FACTOR', 'GLICKO_MAX_RD', 'GLICKO_MIN_RD', 'MAX_RANK', 'TS_MAX_SIGMA', 'TS_MIN_SIGMA', 'BASE_BETA', 'BASE_TAU',
+    'ZeroFloorElo', 'ZeroFloorGlicko',
+]
+
+# Fixed order of the vp_weights / rank_delta_weights keys, so the weights can be read by position (GameMode.vp_vec / rank_delta_vec).
+VP_FEATURES = ('kills', 'deaths', 'killstreak', 'time_alive', 'contesting_kills', 'objective_time', 'accuracy', 'damage_dealt', 'damage_taken')
+VP_SIGNS = np.array([1, -1, 1, 1, 1, 1, 1, 1, -1], dtype=np.float64) # -1 where the lower stat is the better one (deaths, damage_taken)
+VP_SIGNS.setflags(write=False)
+RANK_DELTA_FEATURES = (
+    'kills', 'deaths', 'assists', 'damage_dealt', 'damage_taken', 'damage_missed',
+    'headshot_damage_dealt', 'torso_damage_dealt', 'leg_damage_dealt',
+    'accuracy', 'headshot_accuracy', 'torso_accuracy', 'leg_accuracy',
+    'contesting_kills', 'objective_time', 'longest_time_alive',
+    'kills_per_minute', 'deaths_per_minute', 'assists_per_minute', 'damage_dealt_per_minute', 'damage_taken_per_minute',
+    'kill_death_ratio', 'damage_dealt_and_taken_ratio', 'killstreak', 'win_streak', 'win_loss_ratio', 'is_tie',
+)
+# Integer positions into vp_vec / vp_w and rank_delta_vec / rank_delta_w, e.g. mode.rank_delta_vec[RankDeltaFeature.KILLSTREAK]
+VPFeature = IntEnum('VPFeature', {feature.upper(): i for i, feature in enumerate(VP_FEATURES)})
+RankDeltaFeature = IntEnum('RankDeltaFeature', {feature.upper(): i for i, feature in enumerate(RANK_DELTA_FEATURES)})
+
+# Skill tiers of GameMode.adjustments (the row order of adj_table) and the stats each tier has a mean_* and sd_* for.
+SKILL_TIERS = ('low', 'med', 'high')
+SKILL_IDX = {tier: i for i, tier in enumerate(SKILL_TIERS)}
+ADJ_FEATURES = (
+    'total_games_played', 'total_wins', 'total_loses', 'total_ties', 'win_streak',
+    'kills', 'deaths', 'assists', 'accuracy', 'damage_missed', 'headshot_accuracy', 'torso_accuracy', 'best_killstreak',
+    'longest_time_alive', 'contesting_kills', 'objective_time',
+)
+# The adjustments keys in dict order (mean_*, sd_* per feature), the column order of adj_table
+ADJ_KEYS = tuple(prefix + feature for feature in ADJ_FEATURES for prefix in ('mean_', 'sd_'))
+ADJ_KEY_IDX = {key: i for i, key in enumerate(ADJ_KEYS)}
+# Game history keys that are 0 for a rating whose interpolated mean_total_games_played is 0, and their mask over ADJ_KEYS
+ZERO_EXCLUDE_KEYS = frozenset({
+    'mean_total_games_played', 'sd_total_games_played',
+    'mean_total_wins', 'sd_total_wins',
+    'mean_total_loses', 'sd_total_loses',
+    'mean_total_ties',  'sd_total_ties',
+    'mean_win_streak',  'sd_win_streak',
+})
+ZERO_EXCLUDE_MASK = np.array([key in ZERO_EXCLUDE_KEYS for key in ADJ_KEYS])
+ZERO_EXCLUDE_MASK.setflags(write=False)
+ZERO_EXCLUDE_INDICES = np.flatnonzero(ZERO_EXCLUDE_MASK) # The same positions as an index array, cheaper to assign through than the mask
+ZERO_EXCLUDE_INDICES.setflags(write=False)
+
+# Attributes the rating compares a game player on, with +1 where a higher value is better and -1 where lower is better.
+# Defined before GameMode, whose total_attr_w / rank_avg_w are built from them.
+TOTAL_ATTRIBUTES = [
+    ("kills", 1),
+    ("deaths", -1),
+    ("assists", 1),
+    ("damage_dealt", 1),
+    ("damage_taken", -1),
+    ("damage_missed", -1),
+    ("headshot_damage_dealt", 1),
+    ("torso_damage_dealt", 1),
+    ("leg_damage_dealt", 1),
+    ("accuracy", 1),
+    ("headshot_accuracy", 1),
+    ("torso_accuracy", 1),
+    ("leg_accuracy", 1),
+    ("contesting_kills", 1),
+    ("objective_time", 1),
+    ("longest_time_alive", 1),
+    ("kills_per_minute", 1),
+    ("deaths_per_minute", -1),
+    ("assists_per_minute", 1),
+    ("damage_dealt_per_minute", 1),
+    ("damage_taken_per_minute", -1),
+]
+
+RANK_AVERAGES = [
+    ('kills', 1),
+    ('deaths', -1),
+    ('assists', 1),
+    ('accuracy', 1),
+    ('headshot_accuracy', 1),
+    ('torso_accuracy', 1),
+    ('longest_time_alive', 1),
+    ('contesting_kills', 1),
+    ('objective_time', 1),
+  ]
+
+# The same lists split into parallel names / signs
+TOTAL_ATTR_NAMES = tuple(attr for attr, _ in TOTAL_ATTRIBUTES)
+TOTAL_ATTR_SIGNS = np.array([koef for _, koef in TOTAL_ATTRIBUTES], dtype=np.int8)
+TOTAL_ATTR_SIGNS.setflags(write=False)
+RANK_AVG_NAMES = tuple(attr for attr, _ in RANK_AVERAGES)
+RANK_AVG_SIGNS = np.array([koef for _, koef in RANK_AVERAGES], dtype=np.int8)
+RANK_AVG_SIGNS.setflags(write=False)
+
+# Modes with identical weights share one read-only array instead of each holding a copy
+_WEIGHT_INTERN: dict[tuple, np.ndarray] = {}
+
+def _intern(vec: tuple) -> np.ndarray:
+    weights = _WEIGHT_INTERN.get(vec)
+    if weights is None:
+        weights = np.fromiter(vec, dtype=np.float64, count=len(vec))
+        weights.setflags(write=False)
+        _WEIGHT_INTERN[vec] = weights
+    return weights
+
+def _check_keys(mode_type: str, what: str, keys, expected) -> None:
+    missing, unknown = set(expected) - set(keys), set(keys) - set(expected)
+    if missing or unknown:
+        raise ValueError(f"{mode_type} {what}: missing {sorted(missing)}, unknown {sorted(unknown)}")
+
+BASE_PERFORMANCE = 20.0 # Base rating change per game (before the performance koeficients); the same for every mode unless its spec overrides it
+
+# Shared read-only default for the GameMode dict fields. It goes through default_factory because before Python 3.12
+# mappingproxy is unhashable, and dataclasses reject unhashable plain defaults.
+_EMPTY_MAPPING = MappingProxyType({})
+
+# Modes are built through GameMode.from_spec(), which validates the spec once, so the constructor itself only assigns.
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True) # eq=False keeps identity hashing, so a GameMode can be a dict key
 class GameMode:
-    def __init__(
-        self,
-        type: str,
-        team_size: int,
-        team_count: int,
-        time_limit_mean: int,
-        time_limit_variance: int,
-        kill_cap: int = None,
-        point_limit: int = None,
-        winning_round_limit: int = None,
-        base_performance: float = None,
-        group_sizes: list = None,
-        adjustments: dict = None,
-        vp_weights: dict = None,
-        rank_delta_weights: dict = None,
-    ) -> None:
-        self.type = type
-        self.team_size = team_size
-        self.team_count = team_count
-        self.time_limit_mean = time_limit_mean
-        self.time_limit_variance = time_limit_variance
-        self.kill_cap = kill_cap
-        self.point_limit = point_limit
-        self.winning_round_limit = winning_round_limit
-        self.base_performance = base_performance
-        self.vp_weights = vp_weights if vp_weights is not None else {}
-        self.rank_delta_weights = rank_delta_weights if rank_delta_weights is not None else {}
-        self.group_sizes = group_sizes if group_sizes is not None else []
-        self.adjustments = adjustments if adjustments is not None else {}
-
-GAME_TYPES = [
-    GameMode(
+    type: str
+    team_size: int
+    team_count: int
+    time_limit_mean: int
+    time_limit_variance: int
+    kill_cap: int | None = None
+    point_limit: int | None = None
+    winning_round_limit: int | None = None
+    base_performance: float = BASE_PERFORMANCE
+    group_sizes: tuple = () # Party sizes the simulation groups players into, read by index
+    adjustments: MappingProxyType = field(default_factory=lambda: _EMPTY_MAPPING)
+    vp_weights: MappingProxyType = field(default_factory=lambda: _EMPTY_MAPPING)
+    rank_delta_weights: MappingProxyType = field(default_factory=lambda: _EMPTY_MAPPING)
+    # Shortest game a simulated playtime is clamped to: time_limit_mean - 2 * time_limit_variance
+    min_playtime: int = field(init=False, repr=False)
+    # Weights in VP_FEATURES / RANK_DELTA_FEATURES order, built once per mode
+    vp_vec: tuple = field(init=False, repr=False)
+    rank_delta_vec: tuple = field(init=False, repr=False)
+    # Same weights as read-only float64 arrays for vectorized scoring (float64, so sums match the plain Python float math)
+    vp_w: np.ndarray = field(init=False, repr=False)
+    rank_delta_w: np.ndarray = field(init=False, repr=False)
+    # rank_delta_weights in TOTAL_ATTRIBUTES / RANK_AVERAGES order, already multiplied by each attribute's sign (koef)
+    total_attr_w: tuple = field(init=False, repr=False)
+    rank_avg_w: tuple = field(init=False, repr=False)
+    # adjustments as one read-only (3, len(ADJ_KEYS)) table, rows in SKILL_TIERS order, columns in ADJ_KEYS order
+    adj_table: np.ndarray = field(init=False, repr=False)
+    adj_low: np.ndarray = field(init=False, repr=False) # adj_table rows, i.e. the "low" / "med" / "high" adjustments in ADJ_KEYS order
+    adj_med: np.ndarray = field(init=False, repr=False)
+    adj_high: np.ndarray = field(init=False, repr=False)
+    # Per-key slopes of interpolate_stat over ADJ_KEYS: low -> med (per rating point from 200 to 1300) and med -> high (1300 to 3000)
+    adj_slope_lo: np.ndarray = field(init=False, repr=False)
+    adj_slope_hi: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Frozen, so the derived fields are set through object.__setattr__
+        object.__setattr__(self, 'min_playtime', self.time_limit_mean - (2 * self.time_limit_variance))
+        object.__setattr__(self, 'vp_vec', tuple(self.vp_weights.get(k, 0.0) for k in VP_FEATURES))
+        object.__setattr__(self, 'rank_delta_vec', tuple(self.rank_delta_weights.get(k, 0.0) for k in RANK_DELTA_FEATURES))
+        object.__setattr__(self, 'vp_w', _intern(self.vp_vec))
+        object.__setattr__(self, 'rank_delta_w', _intern(self.rank_delta_vec))
+        object.__setattr__(self, 'total_attr_w', tuple(int(koef) * self.rank_delta_weights.get(attr, 0.0) for attr, koef in zip(TOTAL_ATTR_NAMES, TOTAL_ATTR_SIGNS)))
+        object.__setattr__(self, 'rank_avg_w', tuple(int(koef) * self.rank_delta_weights.get(attr, 0.0) for attr, koef in zip(RANK_AVG_NAMES, RANK_AVG_SIGNS)))
+        if self.adjustments:
+            table = np.array([[self.adjustments[tier][key] for key in ADJ_KEYS] for tier in SKILL_TIERS], dtype=np.float64)
+        else:
+            table = np.zeros((len(SKILL_TIERS), len(ADJ_KEYS)), dtype=np.float64)
+        table.setflags(write=False)
+        object.__setattr__(self, 'adj_table', table)
+        object.__setattr__(self, 'adj_low', table[0])
+        object.__setattr__(self, 'adj_med', table[1])
+        object.__setattr__(self, 'adj_high', table[2])
+        slope_lo, slope_hi = (table[1] - table[0]) / (1300.0 - 200.0), (table[2] - table[1]) / (3000.0 - 1300.0)
+        slope_lo.setflags(write=False)
+        slope_hi.setflags(write=False)
+        object.__setattr__(self, 'adj_slope_lo', slope_lo)
+        object.__setattr__(self, 'adj_slope_hi', slope_hi)
+
+    # Validates a _GAME_TYPE_SPECS entry and wraps its dicts in read-only proxies, so the constructor can trust its input.
+    @classmethod
+    def from_spec(cls, spec: dict) -> 'GameMode':
+        spec = dict(spec)
+        mode_type = spec['type']
+        if 'group_sizes' in spec:
+            spec['group_sizes'] = tuple(spec['group_sizes'])
+        for name, features in (('vp_weights', VP_FEATURES), ('rank_delta_weights', RANK_DELTA_FEATURES)):
+            if name in spec:
+                _check_keys(mode_type, name, spec[name], features)
+                spec[name] = MappingProxyType(spec[name])
+        if 'adjustments' in spec:
+            _check_keys(mode_type, 'adjustments', spec['adjustments'], SKILL_TIERS)
+            for tier in SKILL_TIERS:
+                _check_keys(mode_type, f'adjustments[{tier!r}]', spec['adjustments'][tier], ADJ_KEYS)
+            spec['adjustments'] = MappingProxyType({tier: MappingProxyType(spec['adjustments'][tier]) for tier in SKILL_TIERS})
+        return cls(**spec)
+
+    # n game lengths in whole seconds: N(time_limit_mean, time_limit_variance), rounded and clamped at min_playtime
+    def sample_time(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        return np.maximum(np.rint(rng.normal(self.time_limit_mean, self.time_limit_variance, n)), self.min_playtime)
+
+# TDM and FFA score kills the same way, so they share one rank delta weight dict
+_TDM_FFA_RANK_DELTA_WEIGHTS = {
+    "kills": 1.00,
+    "deaths": 1.00,
+    "assists": 0.10,
+    "damage_dealt": 0.90,
+    "damage_taken": 0.90,
+    "damage_missed": 0.10,
+    "headshot_damage_dealt": 0.50,
+    "torso_damage_dealt": 0.40,
+    "leg_damage_dealt": 0.30,
+    "accuracy": 0.80,
+    "headshot_accuracy": 0.50,
+    "torso_accuracy": 0.40,
+    "leg_accuracy": 0.30,
+    "contesting_kills": 0.00,
+    "objective_time": 0.00,
+    "longest_time_alive": 0.10,
+    "kills_per_minute": 0.95,
+    "deaths_per_minute": 0.95,
+    "assists_per_minute": 0.10,
+    "damage_dealt_per_minute": 0.85,
+    "damage_taken_per_minute": 0.85,
+    "kill_death_ratio": 0.95,
+    "damage_dealt_and_taken_ratio": 0.95,
+    "killstreak": 0.80,
+    "win_streak": 1.00,
+    "win_loss_ratio": 1.00,
+    "is_tie": 1.00
+}
+
+# Both battle royale modes value a player the same way; BR_4V96 overrides a few rank delta weights below
+_BR_VP_WEIGHTS = {
+    'kills': 0.70,
+    'deaths': 0.10,
+    'killstreak': 0.70,
+    'time_alive': 1.00,
+    'contesting_kills': 0.00,
+    'objective_time': 0.00,
+    'accuracy': 0.60,
+    'damage_dealt': 0.68,
+    'damage_taken': 0.50,
+}
+_BR_RANK_DELTA_WEIGHTS = {
+    "kills": 0.90,
+    "deaths": 0.10,
+    "assists": 0.80,
+    "damage_dealt": 0.90,
+    "damage_taken": 0.30,
+    "damage_missed": 0.20,
+    "headshot_damage_dealt": 0.80,
+    "torso_damage_dealt": 0.60,
+    "leg_damage_dealt": 0.15,
+    "accuracy": 0.60,
+    "headshot_accuracy": 0.80,
+    "torso_accuracy": 0.60,
+    "leg_accuracy": 0.15,
+    "contesting_kills": 0.00,
+    "objective_time": 0.00,
+    "longest_time_alive": 1.00,
+    "kills_per_minute": 0.50,
+    "deaths_per_minute": 0.00,
+    "assists_per_minute": 0.40,
+    "damage_dealt_per_minute": 0.50,
+    "damage_taken_per_minute": 0.20,
+    "kill_death_ratio": 0.00,
+    "damage_dealt_and_taken_ratio": 0.35,
+    "killstreak": 0.90,
+    "win_streak": 1.00,
+    "win_loss_ratio": 1.00,
+    "is_tie": 0.00
+}
+
+# Plain keyword data for each mode. GameMode objects are only built for the modes a run asks for, see get_game_mode().
+_GAME_TYPE_SPECS = {
+    "TDM": dict(
         type = "TDM", # Team deathmatch (from Call of Duty)
         team_size = 6,
         team_count = 2,
         time_limit_mean = 600, # seconds or 10 minutes
         time_limit_variance = 120, # seconds or 2 minutes
         kill_cap = 50,
-        base_performance = 20.00,
-        group_sizes = [3, 6],
+        group_sizes = (3, 6),
         vp_weights = {
           'kills': 1.00,
           'deaths': 0.95,
@@ -127,44 +376,15 @@ GAME_TYPES = [
                 'mean_objective_time':0,     'sd_objective_time':0,
             }
         },
-        rank_delta_weights = {
-            "kills": 1.00,
-            "deaths": 1.00,
-            "assists": 0.10,
-            "damage_dealt": 0.90,
-            "damage_taken": 0.90,
-            "damage_missed": 0.10,
-            "headshot_damage_dealt": 0.50,
-            "torso_damage_dealt": 0.40,
-            "leg_damage_dealt": 0.30,
-            "accuracy": 0.80,
-            "headshot_accuracy": 0.50,
-            "torso_accuracy": 0.40,
-            "leg_accuracy": 0.30,
-            "contesting_kills": 0.00,
-            "objective_time": 0.00,
-            "longest_time_alive": 0.10,
-            "kills_per_minute": 0.95,
-            "deaths_per_minute": 0.95,
-            "assists_per_minute": 0.10,
-            "damage_dealt_per_minute": 0.85,
-            "damage_taken_per_minute": 0.85,
-            "kill_death_ratio": 0.95,
-            "damage_dealt_and_taken_ratio": 0.95,
-            "killstreak": 0.80,
-            "win_streak": 1.00,
-            "win_loss_ratio": 1.00,
-            "is_tie": 1.00
-        },
+        rank_delta_weights = _TDM_FFA_RANK_DELTA_WEIGHTS,
     ),
-    GameMode(
+    "FFA": dict(
         type = "FFA", # Free-for-All (from Call of Duty)
         team_size = 1,
         team_count = 12,
         time_limit_mean = 600, # seconds or 10 minutes
         time_limit_variance = 120, # seconds or 2 minutes
         kill_cap = 50,
-        base_performance = 20.00,
         vp_weights = {
           'kills': 1.00,
           'deaths': 0.95,
@@ -250,44 +470,15 @@ GAME_TYPES = [
                 'mean_objective_time':0,     'sd_objective_time':0,
             }
         },
-        rank_delta_weights = {
-            "kills": 1.00,
-            "deaths": 1.00,
-            "assists": 0.10,
-            "damage_dealt": 0.90,
-            "damage_taken": 0.90,
-            "damage_missed": 0.10,
-            "headshot_damage_dealt": 0.50,
-            "torso_damage_dealt": 0.40,
-            "leg_damage_dealt": 0.30,
-            "accuracy": 0.80,
-            "headshot_accuracy": 0.50,
-            "torso_accuracy": 0.40,
-            "leg_accuracy": 0.30,
-            "contesting_kills": 0.00,
-            "objective_time": 0.00,
-            "longest_time_alive": 0.10,
-            "kills_per_minute": 0.95,
-            "deaths_per_minute": 0.95,
-            "assists_per_minute": 0.10,
-            "damage_dealt_per_minute": 0.85,
-            "damage_taken_per_minute": 0.85,
-            "kill_death_ratio": 0.95,
-            "damage_dealt_and_taken_ratio": 0.95,
-            "killstreak": 0.80,
-            "win_streak": 1.00,
-            "win_loss_ratio": 1.00,
-            "is_tie": 1.00
-        },
+        rank_delta_weights = _TDM_FFA_RANK_DELTA_WEIGHTS,
     ),
-    GameMode(
+    "Domination": dict(
         type = "Domination", # Domination (from Call of Duty)
         team_size = 6,
         team_count = 2,
         time_limit_mean = 1020, # seconds or 17 minutes
         time_limit_variance = 180, # seconds or 3 minutes
         point_limit = 200, # 1 point per 5 seconds for each of the 3 zones
-        base_performance = 20.00,
         vp_weights = {
           'kills': 0.54,
           'deaths': 0.48,
@@ -299,7 +490,7 @@ GAME_TYPES = [
           'damage_dealt': 0.59,
           'damage_taken': 0.47,
         },
-        group_sizes = [3, 6],
+        group_sizes = (3, 6),
         adjustments = {
             # Low skill
             "low": {
@@ -404,25 +595,14 @@ GAME_TYPES = [
             "is_tie": 1.00
         },
     ),
-    GameMode(
+    "BR_1V99": dict(
         type = "BR_1V99", # Battle royale 1v99 (from Fortnite)
         team_size = 1,
         team_count = 100,
         time_limit_mean = 1200, # seconds or 20 minutes
         time_limit_variance = 180, # seconds or 3 minutes
         kill_cap = 99,
-        base_performance = 20.00,
-        vp_weights = {
-          'kills': 0.70,
-          'deaths': 0.10,
-          'killstreak': 0.70,
-          'time_alive': 1.00,
-          'contesting_kills': 0.00,
-          'objective_time': 0.00,
-          'accuracy': 0.60,
-          'damage_dealt': 0.68,
-          'damage_taken': 0.50,
-        },
+        vp_weights = _BR_VP_WEIGHTS,
         adjustments = {
             # Low skill
             "low": {
@@ -497,56 +677,17 @@ GAME_TYPES = [
                 'mean_objective_time': 0,  'sd_objective_time':0,
             }
         },
-        rank_delta_weights = {
-            "kills": 0.90,
-            "deaths": 0.10,
-            "assists": 0.80,
-            "damage_dealt": 0.90,
-            "damage_taken": 0.30,
-            "damage_missed": 0.20,
-            "headshot_damage_dealt": 0.80,
-            "torso_damage_dealt": 0.60,
-            "leg_damage_dealt": 0.15,
-            "accuracy": 0.60,
-            "headshot_accuracy": 0.80,
-            "torso_accuracy": 0.60,
-            "leg_accuracy": 0.15,
-            "contesting_kills": 0.00,
-            "objective_time": 0.00,
-            "longest_time_alive": 1.00,
-            "kills_per_minute": 0.50,
-            "deaths_per_minute": 0.00,
-            "assists_per_minute": 0.40,
-            "damage_dealt_per_minute": 0.50,
-            "damage_taken_per_minute": 0.20,
-            "kill_death_ratio": 0.00,
-            "damage_dealt_and_taken_ratio": 0.35,
-            "killstreak": 0.90,
-            "win_streak": 1.00,
-            "win_loss_ratio": 1.00,
-            "is_tie": 0.00
-        },
+        rank_delta_weights = _BR_RANK_DELTA_WEIGHTS,
     ),
-    GameMode(
+    "BR_4V96": dict(
         type = "BR_4V96", # Battle royale 4v96 (from Fortnite)
         team_size = 4,
         team_count = 25,
         time_limit_mean = 1380, # seconds or 23 minutes
         time_limit_variance = 240, # seconds or 4 minutes
         kill_cap = 96,
-        base_performance = 20.00,
-        vp_weights = {
-          'kills': 0.70,
-          'deaths': 0.10,
-          'killstreak': 0.70,
-          'time_alive': 1.00,
-          'contesting_kills': 0.00,
-          'objective_time': 0.00,
-          'accuracy': 0.60,
-          'damage_dealt': 0.68,
-          'damage_taken': 0.50,
-        },
-        group_sizes = [2, 4],
+        vp_weights = _BR_VP_WEIGHTS,
+        group_sizes = (2, 4),
         adjustments = {
             # Low skill
             "low": {
@@ -621,44 +762,23 @@ GAME_TYPES = [
                 'mean_objective_time': 0,  'sd_objective_time':0,
             }
         },
+        # BR_1V99's weights with the team-play stats (assists, damage taken) weighted higher
         rank_delta_weights = {
-            "kills": 0.90,
-            "deaths": 0.10,
+            **_BR_RANK_DELTA_WEIGHTS,
             "assists": 0.82,
-            "damage_dealt": 0.90,
             "damage_taken": 0.80,
-            "damage_missed": 0.20,
-            "headshot_damage_dealt": 0.80,
-            "torso_damage_dealt": 0.60,
-            "leg_damage_dealt": 0.15,
-            "accuracy": 0.60,
-            "headshot_accuracy": 0.80,
-            "torso_accuracy": 0.60,
-            "leg_accuracy": 0.15,
-            "contesting_kills": 0.00,
-            "objective_time": 0.00,
-            "longest_time_alive": 1.00,
-            "kills_per_minute": 0.50,
-            "deaths_per_minute": 0.00,
             "assists_per_minute": 0.42,
-            "damage_dealt_per_minute": 0.50,
             "damage_taken_per_minute": 0.40,
-            "kill_death_ratio": 0.00,
             "damage_dealt_and_taken_ratio": 0.45,
-            "killstreak": 0.90,
-            "win_streak": 1.00,
-            "win_loss_ratio": 1.00,
-            "is_tie": 0.00
         },
     ),
-    GameMode(
+    "SAD": dict(
         type = "SAD", # Search and Destroy (from CS:GO)
         team_size = 5,
         team_count = 2,
         time_limit_mean = 1920, # seconds or 32 minutes
         time_limit_variance = 240, # seconds or 4 minutes
         winning_round_limit = 16, # for each team to win
-        base_performance = 20.00,
         vp_weights = {
           'kills': 0.88,
           'deaths': 0.90,
@@ -670,7 +790,7 @@ GAME_TYPES = [
           'damage_dealt': 0.50,
           'damage_taken': 0.48,
         },
-        group_sizes = [2, 5],
+        group_sizes = (2, 5),
         adjustments = {
             # Low skill
             "low": {
@@ -775,7 +895,30 @@ GAME_TYPES = [
             "is_tie": 1.00
         },
     ),
-]
+}
+GAME_TYPE_NAMES = tuple(_GAME_TYPE_SPECS)
+
+@lru_cache(maxsize=None)
+def get_game_mode(name: str) -> GameMode:
+    return GameMode.from_spec(_GAME_TYPE_SPECS[name]) # Cached, so each mode is validated and built once
+
+# GAME_MODES (name -> GameMode) and GAME_TYPES (all modes, in order) build every mode, so they are only created on first access (PEP 562).
+# The elote based ZeroFloorElo / ZeroFloorGlicko are created the same way, see _define_zero_floor_competitors(),
+# and so is GLOBAL_START_TIME, so importing config does not read the clock.
+def __getattr__(name: str):
+    if name == 'GAME_MODES':
+        value = MappingProxyType({type_name: get_game_mode(type_name) for type_name in GAME_TYPE_NAMES}) # Read-only, shared by every importer
+    elif name == 'GAME_TYPES':
+        value = tuple(get_game_mode(type_name) for type_name in GAME_TYPE_NAMES)
+    elif name in ('ZeroFloorElo', 'ZeroFloorGlicko'):
+        _define_zero_floor_competitors()
+        return globals()[name]
+    elif name == 'GLOBAL_START_TIME':
+        value = datetime.now(_UTC) # Once, then cached in globals() like the rest, so every importer sees the same instant
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 # --------------------------------------------------------------------
 # Interpolation function for continuous scaling across rating ranges.
@@ -785,65 +928,82 @@ GAME_TYPES = [
 #   - at rating 3000: uses high skill metrics.
 # --------------------------------------------------------------------
 def interpolate_stat(low_val, med_val, high_val, true_rating: float) -> int | float:
-    if true_rating <= 200.0:
-        # extrapolate below 200 at slope₁
-        slope = (med_val - low_val) / (1300.0 - 200.0)
-        result = low_val + (true_rating - 200.0) * slope
-
-    elif true_rating <= 1300.0:
-        # interpolate between 200 and 1300
-        slope = (med_val - low_val) / (1300.0 - 200.0)
-        result = low_val + (true_rating - 200.0) * slope
-
+    if true_rating <= 1300.0:
+        # interpolate between 200 and 1300, extrapolate below 200 at the same slope₁
+        anchor, anchor_val, slope = 200.0, low_val, (med_val - low_val) / (1300.0 - 200.0)
     elif true_rating <= 3000.0:
         # interpolate between 1300 and 3000
-        slope = (high_val - med_val) / (3000.0 - 1300.0)
-        result = med_val + (true_rating - 1300.0) * slope
-
+        anchor, anchor_val, slope = 1300.0, med_val, (high_val - med_val) / (3000.0 - 1300.0)
     else:
         # extrapolate above 3000 at slope₂
-        slope = (high_val - med_val) / (3000.0 - 1300.0)
-        result = high_val + (true_rating - 3000.0) * slope
-    
-    return max(result, 0)
+        anchor, anchor_val, slope = 3000.0, high_val, (high_val - med_val) / (3000.0 - 1300.0)
+    return max(anchor_val + (true_rating - anchor) * slope, 0)
+
+# interpolate_stat for every key at once: low / med / high are the three anchor rows, slope_lo / slope_hi their per-key slopes.
+# The rating segment is picked once, the same anchor and slope interpolate_stat uses, so the values match it exactly.
+def interpolate_rows(low: np.ndarray, med: np.ndarray, high: np.ndarray, slope_lo: np.ndarray, slope_hi: np.ndarray, true_rating: float) -> np.ndarray:
+    if true_rating <= 1300.0:
+        result = low + (true_rating - 200.0) * slope_lo
+    elif true_rating <= 3000.0:
+        result = med + (true_rating - 1300.0) * slope_hi
+    else:
+        result = high + (true_rating - 3000.0) * slope_hi
+    return np.maximum(result, 0.0, out=result)
+
+# interpolate_rows for many ratings at once: one row per rating, each computed with its own segment's anchor and slope
+def interpolate_rows_batch(low: np.ndarray, med: np.ndarray, high: np.ndarray, slope_lo: np.ndarray, slope_hi: np.ndarray, true_ratings) -> np.ndarray:
+    ratings = np.asarray(true_ratings, dtype=np.float64)[:, None]
+    result = np.where(ratings <= 1300.0, low + (ratings - 200.0) * slope_lo,
+                      np.where(ratings <= 3000.0, med + (ratings - 1300.0) * slope_hi, high + (ratings - 3000.0) * slope_hi))
+    return np.maximum(result, 0.0, out=result)
 
 def interpolate_stats(low_stats: dict, med_stats: dict, high_stats: dict, true_rating: float) -> dict:
-    result = {}
-
-    result['mean_total_games_played'] = interpolate_stat(
-        low_stats['mean_total_games_played'],
-        med_stats['mean_total_games_played'],
-        high_stats['mean_total_games_played'],
-        true_rating
-    )
-
-    zero_exclude = {
-        'mean_total_games_played', 'sd_total_games_played',
-        'mean_total_wins', 'sd_total_wins',
-        'mean_total_loses', 'sd_total_loses',
-        'mean_total_ties',  'sd_total_ties',
-        'mean_win_streak',  'sd_win_streak',
-    }
-
-    for key in low_stats: # low, medium and high have the same keys
-        if result['mean_total_games_played'] == 0 and key in zero_exclude:
-            result[key] = 0
-        result[key] = interpolate_stat(low_stats[key], med_stats[key], high_stats[key], true_rating)
+    keys = tuple(low_stats) # low, medium and high have the same keys
+    low, med, high = (np.array([stats[key] for key in keys], dtype=np.float64) for stats in (low_stats, med_stats, high_stats))
+    slope_lo, slope_hi = (med - low) / (1300.0 - 200.0), (high - med) / (3000.0 - 1300.0)
+    result = interpolate_rows(low, med, high, slope_lo, slope_hi, true_rating)
+    if result[keys.index('mean_total_games_played')] == 0:
+        result[[key in ZERO_EXCLUDE_KEYS for key in keys]] = 0.0
+    return dict(zip(keys, result.tolist()))
+
+# The interpolated values of one (mode, rating) pair as a read-only float64 array in ADJ_KEYS order (index with ADJ_KEY_IDX).
+# Modes are frozen and hash by identity, and players often share a rating (whole-number starting ratings, the fixed
+# reference rating), so repeated pairs are served from the cache.
+@lru_cache(maxsize=4096)
+def get_stat_vector(game_mode: GameMode, true_rating: float) -> np.ndarray:
+    result = interpolate_rows(game_mode.adj_low, game_mode.adj_med, game_mode.adj_high, game_mode.adj_slope_lo, game_mode.adj_slope_hi, true_rating)
+    if result[0] == 0: # mean_total_games_played
+        result[ZERO_EXCLUDE_INDICES] = 0.0
+    result.setflags(write=False)
+    return result
+
+# Same as interpolate_stats(*game_mode.adjustments.values(), true_rating), from the mode's prebuilt table and slopes.
+# Read-only and cached like get_stat_vector, so repeated (mode, rating) pairs share one mapping; copy with dict() to modify.
+@lru_cache(maxsize=4096)
+def get_stat_parameters(game_mode: GameMode, true_rating: float) -> MappingProxyType:
+    return MappingProxyType(dict(zip(ADJ_KEYS, get_stat_vector(game_mode, true_rating).tolist())))
+
+# get_stat_parameters for a whole array of ratings: a (len(true_ratings), len(ADJ_KEYS)) array, columns in ADJ_KEYS order
+def get_stat_parameters_batch(game_mode: GameMode, true_ratings) -> np.ndarray:
+    result = interpolate_rows_batch(game_mode.adj_low, game_mode.adj_med, game_mode.adj_high, game_mode.adj_slope_lo, game_mode.adj_slope_hi, true_ratings)
+    result[np.ix_(result[:, 0] == 0, ZERO_EXCLUDE_INDICES)] = 0.0 # Rows with mean_total_games_played == 0
     return result
 
-def get_stat_parameters(game_mode: GameMode, true_rating: float) -> dict:
-    low_stats, med_stats, high_stats = (game_mode.adjustments["low"], game_mode.adjustments["med"], game_mode.adjustments["high"],)
-    return interpolate_stats(low_stats, med_stats, high_stats, true_rating)
+_UTC = timezone.utc
 
 # Returns a UTC‑aware datetime or returns unchanged datetime.
 def ensure_utc(dt: datetime) -> datetime:
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc)
+    tz = dt.tzinfo
+    if tz is _UTC: # Already UTC, the common case for the simulation's own timestamps
+        return dt
+    if tz is None:
+        return dt.replace(tzinfo=_UTC)
+    return dt.astimezone(_UTC)
 
 
+# round() without ndigits already returns an int (half to even) for int, float and numpy floats, with no intermediate float
 def roundInt(number) -> int:
-    return int(round(number, 0))
+    return round(number)
 
 # ------------------------
 # CONSTANTS
@@ -860,42 +1020,6 @@ STAT_ATTRS = [
     'damage_taken',
 ]
 
-TOTAL_ATTRIBUTES = [
-    ("kills", 1),
-    ("deaths", -1),
-    ("assists", 1),
-    ("damage_dealt", 1),
-    ("damage_taken", -1),
-    ("damage_missed", -1),
-    ("headshot_damage_dealt", 1),
-    ("torso_damage_dealt", 1),
-    ("leg_damage_dealt", 1),
-    ("accuracy", 1),
-    ("headshot_accuracy", 1),
-    ("torso_accuracy", 1),
-    ("leg_accuracy", 1),
-    ("contesting_kills", 1),
-    ("objective_time", 1),
-    ("longest_time_alive", 1),
-    ("kills_per_minute", 1),
-    ("deaths_per_minute", -1),
-    ("assists_per_minute", 1),
-    ("damage_dealt_per_minute", 1),
-    ("damage_taken_per_minute", -1),
-]
-
-RANK_AVERAGES = [
-    ('kills', 1),
-    ('deaths', -1),
-    ('assists', 1),
-    ('accuracy', 1),
-    ('headshot_accuracy', 1),
-    ('torso_accuracy', 1),
-    ('longest_time_alive', 1),
-    ('contesting_kills', 1),
-    ('objective_time', 1),
-  ]
-
 # If matchmaking testing and player sorting ever gets created, this is a 
 # rating distribution taken from Counter Strike 2 Premier games in 2025: https://csstats.gg/leaderboards
 # RANK_DISTRIBUTION_WEIGHTS = [
@@ -915,10 +1039,8 @@ RANK_DISTRIBUTION_WEIGHTS = [
     2.7027, 2.7027, 2.7027, 2.7027, 2.7027, 2.7027, 2.7027, 2.7027,
     2.7027, 2.7027, 2.7027, 2.7027, 2.7027
 ]
-
-TOTAL_PLAYERS = 2000 # took 2 minutes to build 5000 players (40000 would technically be 16 minutes) For testing (TODO: CHANGE TO 40_000)
-
-DISTRIBUTION = int(TOTAL_PLAYERS / 24)
+# Number of 100-rating buckets. With the uniform weights above, a bucket is just random.randrange(RANK_BUCKET_COUNT).
+RANK_BUCKET_COUNT = len(RANK_DISTRIBUTION_WEIGHTS)
 
 # Half and full team players with corresponding party names for each scenario
 SCENARIO_PLAYER_PARTIES = [
@@ -936,7 +1058,7 @@ REF_INITIAL_TRUE_RATING = 600
 REFERENCE_PLAYER_COUNT = 8
 
 # Time constants
-GLOBAL_START_TIME = datetime.now(timezone.utc) # Global start time for simulation
+# GLOBAL_START_TIME (the global start time for the simulation) is read from the clock on first access, see __getattr__
 
 ONE_WEEK = timedelta(weeks=1)
 ONE_YEAR = timedelta(days=365)
@@ -958,17 +1080,26 @@ BASE_BETA = TS_MAX_SIGMA / 2 # As per trueskill package initial values
 BASE_TAU = TS_MAX_SIGMA / 100 # As per trueskill package initial values
 
 # Monkey patch, because the creators of the elote elo and glicko system didn't think that minimum_rating should be changable.
-class ZeroFloorElo(EloCompetitor):
-    _minimum_rating = 0
-class ZeroFloorGlicko(GlickoCompetitor):
-    _minimum_rating = 0
+# Defined on first access of ZeroFloorElo / ZeroFloorGlicko, because importing elote also imports matplotlib (most of this module's import time).
+def _define_zero_floor_competitors() -> None:
+    from elote import EloCompetitor, GlickoCompetitor
+
+    class ZeroFloorElo(EloCompetitor):
+        _minimum_rating = 0
+    class ZeroFloorGlicko(GlickoCompetitor):
+        _minimum_rating = 0
+
+    for competitor in (ZeroFloorElo, ZeroFloorGlicko):
+        competitor.__qualname__ = competitor.__name__ # Reads as config.ZeroFloorElo, not as a function local
+        globals()[competitor.__name__] = competitor
 
 # "player_number": [(ref_skill_coeficient, ref_games_count, party_coeficient, time_gap, k_factor), ...]
 REF_COEF_AND_GAMES = {
     "player_1": [(1.2, 400, 1.0, 0, ELO_K_FACTOR),(0.3, 400, 1.0, 0, ELO_K_FACTOR)],
     "player_2": [(0.75, 800, 1.0, 0, ELO_K_FACTOR)],
-    "player_3": [(0.82, 1, 1.0, 14, ELO_K_FACTOR) for _ in range(800)],
-    "player_4": [(0.82, 1, 1.0, 30, ELO_K_FACTOR) for _ in range(800)],
+    # 800 references to one shared tuple. The list is re-iterated for every game mode, so it cannot be a one-shot repeat() iterator.
+    "player_3": [(0.82, 1, 1.0, 14, ELO_K_FACTOR)] * 800,
+    "player_4": [(0.82, 1, 1.0, 30, ELO_K_FACTOR)] * 800,
     "player_5": [
         (1.7, 100, 1.0, 0, ELO_K_FACTOR),
         (0.001, 100, 1.0, 0, ELO_K_FACTOR),
@@ -0,0 +1,12 @@
+import numpy as np
+
+# --------------------------------------------------------------------
+# Per-game stat totals of a player's history:
+#   - every game draws each stat from N(mean, sd), clamped at 0,
+#   - stats flagged in `rounded` are whole numbers, so each draw is rounded (half to even, like roundInt) before summing.
+# The standard normal draws come from the caller's numpy Generator, so a SEED gives the same totals.
+# --------------------------------------------------------------------
+def sample_game_totals(rng: np.random.Generator, mean: np.ndarray, sd: np.ndarray, n_games: int, rounded: np.ndarray) -> np.ndarray:
+    draws = np.maximum(mean + sd * rng.standard_normal((n_games, mean.shape[0])), 0.0)
+    draws[:, rounded] = np.rint(draws[:, rounded])
+    return draws.sum(axis=0)
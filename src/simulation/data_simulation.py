@@ -3,8 +3,9 @@ import math
 import random
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Mapping, Tuple
 
+import numpy as np
 import trueskill
 
 from ..database.db_setup import engine, SessionLocal
@@ -17,32 +18,39 @@ from ..config import (
     BASE_BETA,
     BASE_TAU,
     STAT_ATTRS,
-    GAME_TYPES,
+    VP_SIGNS,
+    RankDeltaFeature,
+    GAME_TYPE_NAMES,
     HALF_MINUTE,
     TS_MIN_SIGMA,
     TS_MAX_SIGMA,
     GLICKO_MIN_RD,
     GLICKO_MAX_RD,
-    RANK_AVERAGES,
+    RANK_AVG_NAMES,
     TOTAL_PLAYERS,
-    TOTAL_ATTRIBUTES,
+    TOTAL_ATTR_NAMES,
     GLOBAL_START_TIME,
     REF_COEF_AND_GAMES,
     REFERENCE_PLAYER_COUNT,
     REF_INITIAL_TRUE_RATING,
     SCENARIO_PLAYER_PARTIES,
     DISTRIBUTION,
-    # RANK_DISTRIBUTION_WEIGHTS, # Uncomment this, if you want to use distributions
+    # RANK_DISTRIBUTION_WEIGHTS, RANK_BUCKET_COUNT, # Uncomment this, if you want to use distributions
     ZeroFloorElo,
     ZeroFloorGlicko,
     roundInt,
     ensure_utc,
-    get_stat_parameters
+    get_game_mode,
+    get_stat_parameters,
+    get_stat_parameters_batch,
+    ADJ_KEYS
 )
+from ..sampling import sample_game_totals
 
 seed = os.getenv("SEED") # Set a seed inside .env file to always get the same outcomes for testing purposes.
 if seed is not None:
     random.seed(int(seed))
+rng = np.random.default_rng(int(seed) if seed is not None else None) # numpy draws follow the same SEED
 
 # Logging for debugging
 logging.basicConfig(level=logging.INFO)
@@ -52,18 +60,30 @@ session = SessionLocal() # Setup SQLAlchemy engine and session for creating reco
 
 Base.metadata.create_all(engine) # Creates tables, if none exist
 
+# Stats drawn once per game of a player's initial history (clamped at 0 and summed); only the accuracies are not whole numbers
+PER_GAME_STATS = ('accuracy', 'headshot_accuracy', 'torso_accuracy', 'kills', 'deaths', 'assists', 'contesting_kills', 'objective_time', 'longest_time_alive')
+PER_GAME_ROUNDED = np.array([stat not in ('accuracy', 'headshot_accuracy', 'torso_accuracy') for stat in PER_GAME_STATS])
+
+# Stats a game player is compared on against every other player of the same game, one column each in the opponent stat matrix
+OPPONENT_ATTRS = TOTAL_ATTR_NAMES + ("killstreak", "kill_death_ratio", "damage_dealt_and_taken_ratio")
+
+def opponent_stat_row(game_player: GamePlayer) -> List[float]:
+    return [getattr(game_player, attr) for attr in OPPONENT_ATTRS]
+
+# Sum of `count` draws of N(mean, sd), each rounded and floored like max(roundInt(random.gauss(mean, sd)), floor), in one numpy call
+def sum_rounded_draws(mean: float, sd: float, count: int, floor: int = 0) -> int:
+    return int(np.maximum(np.rint(rng.normal(mean, sd, count)), floor).sum())
+
 """
 Simulate the passage of time for a game.
 """
 def simulate_game_time(prev_time: datetime, game_type: GameMode) -> Tuple[datetime, int]:
-    mean = game_type.time_limit_mean
-    variance = game_type.time_limit_variance
-    playtime = max(roundInt(random.gauss(mean, variance)), mean - (2 * variance))
+    playtime = max(roundInt(random.gauss(game_type.time_limit_mean, game_type.time_limit_variance)), game_type.min_playtime)
     new_time = prev_time + timedelta(seconds=playtime) + GAME_GAP
     return new_time, playtime
 
 
-def compute_game_player_stats(game_type: GameMode, rank_avg_stats: dict, playtime: int) -> Dict[str, Any]:
+def compute_game_player_stats(game_type: GameMode, rank_avg_stats: Mapping[str, float], playtime: int) -> Dict[str, Any]:
     # Random Gausian values based on averages for rank
     accuracy = max(random.gauss((rank_avg_stats["mean_accuracy"]), (rank_avg_stats["sd_accuracy"])), 0.0)
     
@@ -92,11 +112,12 @@ def compute_game_player_stats(game_type: GameMode, rank_avg_stats: dict, playtim
     torso_damage_dealt = roundInt(total_damage * torso_accuracy)
     leg_damage_dealt = total_damage - headshot_damage_dealt - torso_damage_dealt
 
-    kills_per_minute = kills / playtime * 60 if playtime > 0 else 0.0
-    deaths_per_minute = deaths / playtime * 60 if playtime > 0 else 0.0
-    assists_per_minute = assists / playtime * 60 if playtime > 0 else 0.0
-    damage_dealt_per_minute = damage_dealt / playtime * 60 if playtime > 0 else 0.0
-    damage_taken_per_minute = damage_taken / playtime * 60 if playtime > 0 else 0.0
+    per_minute = 60 / playtime if playtime > 0 else 0.0 # One division, then a multiply per stat
+    kills_per_minute = kills * per_minute
+    deaths_per_minute = deaths * per_minute
+    assists_per_minute = assists * per_minute
+    damage_dealt_per_minute = damage_dealt * per_minute
+    damage_taken_per_minute = damage_taken * per_minute
 
     kill_death_ratio = kills / deaths if deaths > 0 else 0.0
     damage_dealt_and_taken_ratio = damage_dealt / damage_taken if damage_taken > 0 else 0.0
@@ -158,6 +179,21 @@ def compute_game_player_stats(game_type: GameMode, rank_avg_stats: dict, playtim
     }
 
 
+"""
+Score every game player for MVP and LVP: a player collects the vp weight of each stat they are best (or worst) at.
+"""
+def score_valuable_players(game_type: GameMode, game_players: List[GamePlayer]) -> Tuple[List[float], List[float]]:
+    stats = np.array([
+        (p.kills, p.deaths, p.killstreak, p.longest_time_alive, p.contesting_kills, p.objective_time, p.accuracy, p.damage_dealt, p.damage_taken)
+        for p in game_players
+    ], dtype=np.float64) * VP_SIGNS # Flipped, so the best value is always the maximum
+
+    # argmax/argmin return the first best/worst player, the same one max()/min() would pick
+    mvp_scores = np.bincount(stats.argmax(axis=0), weights=game_type.vp_w, minlength=len(game_players))
+    lvp_scores = np.bincount(stats.argmin(axis=0), weights=game_type.vp_w, minlength=len(game_players))
+    return mvp_scores.tolist(), lvp_scores.tolist()
+
+
 def compute_remaining_game_player_stats(game_player: GamePlayer, playtime: int, is_mvp: bool, is_lvp: bool) -> Dict[str, Any]:
     damage_missed = roundInt((game_player.damage_dealt / game_player.accuracy) - game_player.damage_dealt) if game_player.accuracy else 0
 
@@ -167,11 +203,12 @@ def compute_remaining_game_player_stats(game_player: GamePlayer, playtime: int,
     torso_damage_dealt = roundInt(total_damage * game_player.torso_accuracy)
     leg_damage_dealt = total_damage - headshot_damage_dealt - torso_damage_dealt
 
-    kills_per_minute = game_player.kills / playtime * 60 if playtime else 0.0
-    deaths_per_minute = game_player.deaths / playtime * 60 if playtime else 0.0
-    assists_per_minute = game_player.assists / playtime * 60 if playtime else 0.0
-    damage_dealt_per_minute = game_player.damage_dealt / playtime * 60 if playtime else 0.0
-    damage_taken_per_minute = game_player.damage_taken / playtime * 60 if playtime else 0.0
+    per_minute = 60 / playtime if playtime else 0.0
+    kills_per_minute = game_player.kills * per_minute
+    deaths_per_minute = game_player.deaths * per_minute
+    assists_per_minute = game_player.assists * per_minute
+    damage_dealt_per_minute = game_player.damage_dealt * per_minute
+    damage_taken_per_minute = game_player.damage_taken * per_minute
 
     kill_death_ratio = game_player.kills / game_player.deaths if game_player.deaths else 0.0
     damage_dealt_and_taken_ratio = game_player.damage_dealt / game_player.damage_taken if game_player.damage_taken else 0.0
@@ -248,90 +285,81 @@ def compute_remaining_game_player_stats(game_player: GamePlayer, playtime: int,
         "glicko_rd_after": glicko_rd_after,
     }
 
-def calculate_game_player_rating(game_type: GameMode, game_player: GamePlayer, player_stats: PlayerGameTypeStats, player_average_stats: dict, team_elo, team_glicko, game_players_to_insert) -> int:
+def calculate_game_player_rating(game_type: GameMode, game_player: GamePlayer, player_stats: PlayerGameTypeStats, player_average_stats: Mapping[str, float], team_elo, team_glicko, game_players_to_insert, opponent_stats: np.ndarray, row: int) -> int:
+    # The fixed-name weights, read once by position instead of by string key in every branch below
+    rank_delta_vec = game_type.rank_delta_vec
+    killstreak_weight = rank_delta_vec[RankDeltaFeature.KILLSTREAK]
+    kill_death_ratio_weight = rank_delta_vec[RankDeltaFeature.KILL_DEATH_RATIO]
+    damage_ratio_weight = rank_delta_vec[RankDeltaFeature.DAMAGE_DEALT_AND_TAKEN_RATIO]
+    win_streak_weight = rank_delta_vec[RankDeltaFeature.WIN_STREAK]
+    win_loss_ratio_weight = rank_delta_vec[RankDeltaFeature.WIN_LOSS_RATIO]
+    is_tie_weight = rank_delta_vec[RankDeltaFeature.IS_TIE]
+
     total_avg_deltas = {}
 
-    for (attr, koef) in TOTAL_ATTRIBUTES:
+    for attr, weight in zip(TOTAL_ATTR_NAMES, game_type.total_attr_w):
         if getattr(player_stats, f"avg_{attr}") > 0:
-            total_avg_deltas[f"delta_{attr}"] = koef * game_type.rank_delta_weights[attr] * (getattr(game_player, attr) - getattr(player_stats, f"avg_{attr}")) / getattr(player_stats, f"avg_{attr}")
+            total_avg_deltas[f"delta_{attr}"] = weight * (getattr(game_player, attr) - getattr(player_stats, f"avg_{attr}")) / getattr(player_stats, f"avg_{attr}")
         else:
-            total_avg_deltas[f"delta_{attr}"] = koef * game_type.rank_delta_weights[attr] * 1.0 if getattr(game_player, attr) > 0.0 else 0.0
+            total_avg_deltas[f"delta_{attr}"] = weight * 1.0 if getattr(game_player, attr) > 0.0 else 0.0
 
     if player_stats.best_killstreak > 0:
-        total_avg_deltas["delta_killstreak"] = game_type.rank_delta_weights["killstreak"] * (game_player.killstreak - player_stats.best_killstreak) / player_stats.best_killstreak
+        total_avg_deltas["delta_killstreak"] = killstreak_weight * (game_player.killstreak - player_stats.best_killstreak) / player_stats.best_killstreak
     else:
-        total_avg_deltas["delta_killstreak"] = game_type.rank_delta_weights["killstreak"] * 1.0 if game_player.killstreak > 0 else 0.0
+        total_avg_deltas["delta_killstreak"] = killstreak_weight * 1.0 if game_player.killstreak > 0 else 0.0
    
     if player_stats.total_kill_death_ratio > 0:
-        total_avg_deltas["delta_kill_death_ratio"] = game_type.rank_delta_weights["kill_death_ratio"] * (game_player.kill_death_ratio - player_stats.total_kill_death_ratio) / player_stats.total_kill_death_ratio
+        total_avg_deltas["delta_kill_death_ratio"] = kill_death_ratio_weight * (game_player.kill_death_ratio - player_stats.total_kill_death_ratio) / player_stats.total_kill_death_ratio
     else:
-        total_avg_deltas["delta_kill_death_ratio"] = game_type.rank_delta_weights["kill_death_ratio"] * 1.0 if game_player.kill_death_ratio > 0.0 else 0.0
+        total_avg_deltas["delta_kill_death_ratio"] = kill_death_ratio_weight * 1.0 if game_player.kill_death_ratio > 0.0 else 0.0
 
     if player_stats.total_damage_dealt_and_taken_ratio > 0:
-        total_avg_deltas["delta_damage_dealt_and_taken_ratio"] = game_type.rank_delta_weights["damage_dealt_and_taken_ratio"] * (game_player.damage_dealt_and_taken_ratio - player_stats.total_damage_dealt_and_taken_ratio) / player_stats.total_damage_dealt_and_taken_ratio
+        total_avg_deltas["delta_damage_dealt_and_taken_ratio"] = damage_ratio_weight * (game_player.damage_dealt_and_taken_ratio - player_stats.total_damage_dealt_and_taken_ratio) / player_stats.total_damage_dealt_and_taken_ratio
     else:
-        total_avg_deltas["delta_damage_dealt_and_taken_ratio"] = game_type.rank_delta_weights["damage_dealt_and_taken_ratio"] * 1.0 if game_player.damage_dealt_and_taken_ratio > 0.0 else 0.0
+        total_avg_deltas["delta_damage_dealt_and_taken_ratio"] = damage_ratio_weight * 1.0 if game_player.damage_dealt_and_taken_ratio > 0.0 else 0.0
 
     rank_avg_deltas = {}
 
-    for (attr, koef) in RANK_AVERAGES:
+    for attr, weight in zip(RANK_AVG_NAMES, game_type.rank_avg_w):
         if player_stats.total_games_played == 0:
             rank_avg_deltas[f"delta_{attr}"] = 0.0
         elif player_average_stats[f"mean_{attr}"] > 0:
-            rank_avg_deltas[f"delta_{attr}"] = koef * game_type.rank_delta_weights[attr] * (getattr(game_player, attr) - player_average_stats[f"mean_{attr}"]) / player_average_stats[f"mean_{attr}"]
+            rank_avg_deltas[f"delta_{attr}"] = weight * (getattr(game_player, attr) - player_average_stats[f"mean_{attr}"]) / player_average_stats[f"mean_{attr}"]
         else:
-            rank_avg_deltas[f"delta_{attr}"] = koef * game_type.rank_delta_weights[attr] * 1.0 if getattr(game_player, attr) > 0.0 else 0.0
+            rank_avg_deltas[f"delta_{attr}"] = weight * 1.0 if getattr(game_player, attr) > 0.0 else 0.0
 
     if player_stats.total_games_played == 0:
         rank_avg_deltas["delta_killstreak"] = 0.0
     elif player_average_stats["mean_best_killstreak"] > 0:
-        rank_avg_deltas["delta_killstreak"] = game_type.rank_delta_weights["killstreak"] * (game_player.killstreak - player_average_stats["mean_best_killstreak"]) / player_average_stats["mean_best_killstreak"]
+        rank_avg_deltas["delta_killstreak"] = killstreak_weight * (game_player.killstreak - player_average_stats["mean_best_killstreak"]) / player_average_stats["mean_best_killstreak"]
     else:
-        rank_avg_deltas["delta_killstreak"] = game_type.rank_delta_weights["killstreak"] * 1.0 if game_player.killstreak > 0 else 0.0
+        rank_avg_deltas["delta_killstreak"] = killstreak_weight * 1.0 if game_player.killstreak > 0 else 0.0
 
     if player_stats.total_games_played == 0:
         rank_avg_deltas["delta_win_streak"] = 0.0
     elif player_average_stats["mean_win_streak"] > 0:
-        rank_avg_deltas["delta_win_streak"] = game_type.rank_delta_weights["win_streak"] * (player_stats.win_streak - player_average_stats["mean_win_streak"]) / player_average_stats["mean_win_streak"]
+        rank_avg_deltas["delta_win_streak"] = win_streak_weight * (player_stats.win_streak - player_average_stats["mean_win_streak"]) / player_average_stats["mean_win_streak"]
     else:
-        rank_avg_deltas["delta_win_streak"] = game_type.rank_delta_weights["win_streak"] * 1.0 if player_stats.win_streak > 0 else 0.0
+        rank_avg_deltas["delta_win_streak"] = win_streak_weight * 1.0 if player_stats.win_streak > 0 else 0.0
 
     opponent_weight = 0
 
-    for each_player in game_players_to_insert:
-        if each_player.player_id == game_player.player_id:
-            continue
-        else:
-            player_deltas = {}
-
-            for (attr, koef) in TOTAL_ATTRIBUTES:
-                if getattr(each_player, attr) > 0:
-                    player_deltas[f"delta_{attr}"] = koef * game_type.rank_delta_weights[attr] * (getattr(game_player, attr) - getattr(each_player, attr)) / getattr(each_player, attr)
-                else:
-                    player_deltas[f"delta_{attr}"] = koef * game_type.rank_delta_weights[attr] * 1.0 if getattr(game_player, attr) > 0.0 else 0.0
-
-            if each_player.killstreak > 0:
-                player_deltas["delta_killstreak"] = game_type.rank_delta_weights["killstreak"] * (game_player.killstreak - each_player.killstreak) / each_player.killstreak
-            else:
-                player_deltas["delta_killstreak"] = game_type.rank_delta_weights["killstreak"] * 1.0 if game_player.killstreak > 0 else 0.0
-          
-            if each_player.kill_death_ratio > 0:
-                player_deltas["delta_kill_death_ratio"] = game_type.rank_delta_weights["kill_death_ratio"] * (game_player.kill_death_ratio - each_player.kill_death_ratio) / each_player.kill_death_ratio
-            else:
-                player_deltas["delta_kill_death_ratio"] = game_type.rank_delta_weights["kill_death_ratio"] * 1.0 if game_player.kill_death_ratio > 0.0 else 0.0
-
-            if each_player.damage_dealt_and_taken_ratio > 0:
-                player_deltas["delta_damage_dealt_and_taken_ratio"] = game_type.rank_delta_weights["damage_dealt_and_taken_ratio"] * (game_player.damage_dealt_and_taken_ratio - each_player.damage_dealt_and_taken_ratio) / each_player.damage_dealt_and_taken_ratio
-            else:
-                player_deltas["delta_damage_dealt_and_taken_ratio"] = game_type.rank_delta_weights["damage_dealt_and_taken_ratio"] * 1.0 if game_player.damage_dealt_and_taken_ratio > 0.0 else 0.0
-
-            opponent_weight += sum(player_deltas.values()) / len(player_deltas)
+    # Deltas against every other player at once: one row per opponent, one column per OPPONENT_ATTRS stat
+    opponent_w = np.array((*game_type.total_attr_w, killstreak_weight, kill_death_ratio_weight, damage_ratio_weight))
+    own_stats = opponent_stats[row]
+    others = np.delete(opponent_stats, row, axis=0)
+    if len(others):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            relative = opponent_w * (own_stats - others) / others
+        player_deltas = np.where(others > 0, relative, np.where(own_stats > 0, opponent_w, 0.0))
+        # cumsum adds left to right, so the row sums and their running total round exactly like the per-opponent loop did
+        opponent_weight = float(np.cumsum(np.cumsum(player_deltas, axis=1)[:, -1] / len(OPPONENT_ATTRS))[-1])
 
     opponent_weight = opponent_weight / (game_type.team_size * game_type.team_count - 1)
 
     other_deltas = {}
 
-    other_deltas["delta_win_loss_ratio"] = game_type.rank_delta_weights["win_loss_ratio"] * (player_stats.win_loss_ratio - 0.5) / 0.5 if player_stats.total_games_played > 0 else 0.0
+    other_deltas["delta_win_loss_ratio"] = win_loss_ratio_weight * (player_stats.win_loss_ratio - 0.5) / 0.5 if player_stats.total_games_played > 0 else 0.0
 
     other_deltas["delta_is_most_valuable_player"] = roundInt(game_player.is_most_valuable_player is True) * 1.0
 
@@ -347,7 +375,7 @@ def calculate_game_player_rating(game_type: GameMode, game_player: GamePlayer, p
     else:
         win_deltas["delta_placement"] = ((mid - game_player.team_placement) / range_from_mid)
 
-    win_deltas["delta_tie"] = game_type.rank_delta_weights["is_tie"] * -0.5 if game_player.is_tie is True else game_type.rank_delta_weights["is_tie"] * 0.5
+    win_deltas["delta_tie"] = is_tie_weight * -0.5 if game_player.is_tie is True else is_tie_weight * 0.5
 
     
     total_avg_weight = 0.13 * sum(total_avg_deltas.values()) / len(total_avg_deltas)
@@ -529,45 +557,49 @@ def compute_player_game_type_stats(game_type: GameMode, true_rating: float, rank
     total_loses = total_games_played - total_wins - total_ties
     win_streak = max(roundInt(random.gauss(rank_avg_stats["mean_win_streak"], rank_avg_stats["sd_win_streak"])), 0) if total_wins > 0 else 0
    
-    total_accuracy = sum(max(random.gauss(rank_avg_stats["mean_accuracy"], rank_avg_stats["sd_accuracy"]), 0.0) for _ in range(total_games_played)) / (total_games_played) if total_games_played > 0 else 0.0
+    # All per-game stats of the player's history are drawn in one block, see PER_GAME_STATS
+    if total_games_played > 0:
+        per_game_means = np.array([rank_avg_stats[f"mean_{stat}"] for stat in PER_GAME_STATS])
+        per_game_sds = np.array([rank_avg_stats[f"sd_{stat}"] for stat in PER_GAME_STATS])
+        per_game_totals = sample_game_totals(rng, per_game_means, per_game_sds, total_games_played, PER_GAME_ROUNDED).tolist()
+    else:
+        per_game_totals = [0.0] * len(PER_GAME_STATS)
+    (sum_accuracy, sum_headshot_accuracy, sum_torso_accuracy, total_kills, total_deaths, total_assists,
+     total_contesting_kills, total_objective_time, total_longest_time_alive) = per_game_totals
+
+    total_accuracy = sum_accuracy / total_games_played if total_games_played > 0 else 0.0
 
-    total_kills = 0
-    total_deaths = 0
-    total_assists = 0
     if total_accuracy > 0.0 and total_games_played > 0:
-        total_kills = sum(roundInt(max(random.gauss(rank_avg_stats["mean_kills"], rank_avg_stats["sd_kills"]), 0)) for _ in range(total_games_played))
-        total_deaths = sum(roundInt(max(random.gauss(rank_avg_stats["mean_deaths"], rank_avg_stats["sd_deaths"]), 0)) for _ in range(total_games_played))
-        total_assists = sum(roundInt(max(random.gauss(rank_avg_stats["mean_assists"], rank_avg_stats["sd_assists"]), 0)) for _ in range(total_games_played))
+        total_kills, total_deaths, total_assists = int(total_kills), int(total_deaths), int(total_assists)
+    else:
+        total_kills = total_deaths = total_assists = 0
     
     avg_kills = total_kills / total_games_played if total_games_played > 0 else 0.0
     avg_deaths = total_deaths / total_games_played if total_games_played > 0 else 0.0
     avg_assists = total_assists / total_games_played if total_games_played > 0 else 0.0
 
+    # Every game: roundInt(avg_kills) kill hits of ~100 damage and roundInt(avg_assists) assist hits of ~35 damage
     total_damage_dealt = 0
     if total_accuracy > 0.0:
-        for _ in range(total_games_played):
-            total_damage_dealt += sum(roundInt(max(random.gauss(100, 5), 0)) for _ in range(roundInt(avg_kills))) + sum(roundInt(max(random.gauss(35, 34), 0)) for _ in range(roundInt(avg_assists)))
+        total_damage_dealt = sum_rounded_draws(100, 5, total_games_played * roundInt(avg_kills)) + sum_rounded_draws(35, 34, total_games_played * roundInt(avg_assists))
     
-    total_damage_taken = 0
-    for _ in range(total_games_played):
-        total_damage_taken += sum(roundInt(max(random.gauss(100, 5), 0)) for _ in range(roundInt(avg_deaths)))
+    total_damage_taken = sum_rounded_draws(100, 5, total_games_played * roundInt(avg_deaths))
  
     best_killstreak = 0
     if game_type.type in ['BR_1V99', 'BR_4V96']:
         best_killstreak = total_kills
-    else:
-        for _ in range(total_games_played):
-            best_killstreak = max(best_killstreak, min(roundInt(max(random.gauss(rank_avg_stats["mean_best_killstreak"], rank_avg_stats["sd_best_killstreak"]), 0)), total_kills)) if total_kills > 0 else 0
+    elif total_kills > 0 and total_games_played > 0:
+        # Best of one draw per game, capped at total_kills
+        best_killstreak = max(min(int(np.rint(rng.normal(rank_avg_stats["mean_best_killstreak"], rank_avg_stats["sd_best_killstreak"], total_games_played)).max()), total_kills), 0)
 
-    total_headshot_accuracy = sum(max(random.gauss(rank_avg_stats["mean_headshot_accuracy"], rank_avg_stats["sd_headshot_accuracy"]), 0.0) for _ in range(total_games_played)) / (total_games_played) if total_games_played > 0 else 0.0
-    total_torso_accuracy = sum(max(random.gauss(rank_avg_stats["mean_torso_accuracy"], rank_avg_stats["sd_torso_accuracy"]), 0.0) for _ in range(total_games_played)) / (total_games_played) if total_games_played > 0 else 0.0
+    total_headshot_accuracy = sum_headshot_accuracy / total_games_played if total_games_played > 0 else 0.0
+    total_torso_accuracy = sum_torso_accuracy / total_games_played if total_games_played > 0 else 0.0
     
     total_damage_missed = 0
     if total_accuracy > 0.0 and total_damage_dealt > 0:
         total_damage_missed = roundInt(total_damage_dealt / total_accuracy - total_damage_dealt)
     else:
-        for _ in range(total_games_played):
-            total_damage_missed += max(roundInt(random.gauss(rank_avg_stats["mean_damage_missed"], rank_avg_stats["sd_damage_missed"])), 0)
+        total_damage_missed = sum_rounded_draws(rank_avg_stats["mean_damage_missed"], rank_avg_stats["sd_damage_missed"], total_games_played)
 
     total_leg_accuracy = total_accuracy - total_headshot_accuracy - total_torso_accuracy
 
@@ -577,19 +609,18 @@ def compute_player_game_type_stats(game_type: GameMode, true_rating: float, rank
     total_torso_damage_dealt = roundInt(total_damage * total_torso_accuracy)
     total_leg_damage_dealt = total_damage - total_headshot_damage_dealt - total_torso_damage_dealt
 
-    total_contesting_kills = sum(roundInt(max(random.gauss(rank_avg_stats["mean_contesting_kills"], rank_avg_stats["sd_contesting_kills"]), 0)) for _ in range(total_games_played))
-    total_objective_time = sum(roundInt(max(random.gauss(rank_avg_stats["mean_objective_time"], rank_avg_stats["sd_objective_time"]), 0)) for _ in range(total_games_played))
-    total_longest_time_alive = sum(roundInt(max(random.gauss(rank_avg_stats["mean_longest_time_alive"], rank_avg_stats["sd_longest_time_alive"]), 0)) for _ in range(total_games_played))
+    total_contesting_kills = int(total_contesting_kills)
+    total_objective_time = int(total_objective_time)
+    total_longest_time_alive = int(total_longest_time_alive)
 
-    total_playtime = 0
-    for _ in range(total_games_played):
-        total_playtime += max(roundInt(random.gauss(game_type.time_limit_mean, game_type.time_limit_variance)), game_type.time_limit_mean - (2 * game_type.time_limit_variance))
+    total_playtime = int(game_type.sample_time(total_games_played, rng).sum())
 
-    total_kills_per_minute = total_kills / total_playtime * 60 if total_playtime > 0 else 0.0
-    total_deaths_per_minute = total_deaths / total_playtime * 60 if total_playtime > 0 else 0.0
-    total_assists_per_minute = total_assists / total_playtime * 60 if total_playtime > 0 else 0.0
-    total_damage_dealt_per_minute = total_damage_dealt / total_playtime * 60 if total_playtime > 0 else 0.0
-    total_damage_taken_per_minute = total_damage_taken / total_playtime * 60 if total_playtime > 0 else 0.0
+    per_minute = 60 / total_playtime if total_playtime > 0 else 0.0
+    total_kills_per_minute = total_kills * per_minute
+    total_deaths_per_minute = total_deaths * per_minute
+    total_assists_per_minute = total_assists * per_minute
+    total_damage_dealt_per_minute = total_damage_dealt * per_minute
+    total_damage_taken_per_minute = total_damage_taken * per_minute
 
     total_kill_death_ratio = total_kills / total_deaths if total_deaths > 0 else float(total_kills)
     total_damage_dealt_and_taken_ratio = total_damage_dealt / total_damage_taken if total_damage_taken > 0 else float(total_damage_dealt)
@@ -705,16 +736,25 @@ def simulate_player_game_type_stats(game_type: GameMode, ref_players_ids: List[i
     stats_to_create = []
     interval_index = 0
     player_id_countdown = DISTRIBUTION # Remove this if you want to use distributions
-    for player in session.query(Player).all():
+    players = session.query(Player).all()
+    true_ratings = []
+    for player in players:
         if player.id in ref_players_ids:
             true_rating = REF_INITIAL_TRUE_RATING
         else:
             if player_id_countdown == 0: # Remove this if you want to use distributions
                 interval_index += 1 # Remove this if you want to use distributions
                 player_id_countdown = DISTRIBUTION - 1 # Remove this if you want to use distributions
-            # interval_index = random.choices(range(len(RANK_DISTRIBUTION_WEIGHTS)), weights=RANK_DISTRIBUTION_WEIGHTS)[0] # Uncomment this, if you want to use distributions
+            # interval_index = random.randrange(RANK_BUCKET_COUNT) # Uncomment this, if you want to use distributions (uniform RANK_DISTRIBUTION_WEIGHTS)
+            # interval_index = random.choices(range(RANK_BUCKET_COUNT), weights=RANK_DISTRIBUTION_WEIGHTS)[0] # Or this, with the Counter Strike 2 weights
             true_rating = random.randint(interval_index * 100, interval_index * 100 + 99) * 1.0
-        player_stats = get_stat_parameters(game_type, true_rating)
+        true_ratings.append(true_rating)
+        player_id_countdown -= 1
+
+    # Stat parameters of every player in one batch, then one dict per player
+    all_player_stats = get_stat_parameters_batch(game_type, true_ratings).tolist()
+    for player, true_rating, player_stats in zip(players, true_ratings, all_player_stats):
+        player_stats = dict(zip(ADJ_KEYS, player_stats))
         computed_stats = compute_player_game_type_stats(game_type, true_rating, player_stats)
 
         stats = PlayerGameTypeStats(
@@ -725,7 +765,6 @@ def simulate_player_game_type_stats(game_type: GameMode, ref_players_ids: List[i
             **computed_stats
         )
         stats_to_create.append(stats)
-        player_id_countdown -= 1
     session.add_all(stats_to_create)
     session.commit()
     logger.info("Created stats for all players.")
@@ -1285,36 +1324,12 @@ def simulate_game_mode_games(game_type: GameMode, ref_players_ids: List[int], en
                                 player.is_tie = False
                                 
                 
-                mvp_attributes = {
-                    'most_kills':            (max(game_players_to_insert, key=lambda p: p.kills).player_id, game_type.vp_weights['kills']),
-                    'least_deaths':          (min(game_players_to_insert, key=lambda p: p.deaths).player_id, game_type.vp_weights['deaths']),
-                    'highest_killstreak':    (max(game_players_to_insert, key=lambda p: p.killstreak).player_id, game_type.vp_weights['killstreak']),
-                    'longest_time_alive':    (max(game_players_to_insert, key=lambda p: p.longest_time_alive).player_id, game_type.vp_weights['time_alive']),
-                    'most_contesting_kills': (max(game_players_to_insert, key=lambda p: p.contesting_kills).player_id, game_type.vp_weights['contesting_kills']),
-                    'highest_objective_time':(max(game_players_to_insert, key=lambda p: p.objective_time).player_id, game_type.vp_weights['objective_time']),
-                    'highest_accuracy':      (max(game_players_to_insert, key=lambda p: p.accuracy).player_id, game_type.vp_weights['accuracy']),
-                    'highest_damage_dealt':  (max(game_players_to_insert, key=lambda p: p.damage_dealt).player_id, game_type.vp_weights['damage_dealt']),
-                    'lowest_damage_taken':   (min(game_players_to_insert, key=lambda p: p.damage_taken).player_id, game_type.vp_weights['damage_taken']),
-                }
-
-                lvp_attributes = {
-                    'least_kills':           (min(game_players_to_insert, key=lambda p: p.kills).player_id, game_type.vp_weights['kills']),
-                    'most_deaths':           (max(game_players_to_insert, key=lambda p: p.deaths).player_id, game_type.vp_weights['deaths']),
-                    'lowest_killstreak':     (min(game_players_to_insert, key=lambda p: p.killstreak).player_id, game_type.vp_weights['killstreak']),
-                    'shortest_time_alive':   (min(game_players_to_insert, key=lambda p: p.longest_time_alive).player_id, game_type.vp_weights['time_alive']),
-                    'least_contesting_kills':(min(game_players_to_insert, key=lambda p: p.contesting_kills).player_id, game_type.vp_weights['contesting_kills']),
-                    'lowest_objective_time': (min(game_players_to_insert, key=lambda p: p.objective_time).player_id, game_type.vp_weights['objective_time']),
-                    'lowest_accuracy':       (min(game_players_to_insert, key=lambda p: p.accuracy).player_id, game_type.vp_weights['accuracy']),
-                    'lowest_damage_dealt':   (min(game_players_to_insert, key=lambda p: p.damage_dealt).player_id, game_type.vp_weights['damage_dealt']),
-                    'highest_damage_taken':  (max(game_players_to_insert, key=lambda p: p.damage_taken).player_id, game_type.vp_weights['damage_taken']),
-                }
+                mvp_scores, lvp_scores = score_valuable_players(game_type, game_players_to_insert)
 
                 current_mvp = (0, 0.0)
                 current_lvp = (0, 0.0)
 
-                for player in game_players_to_insert:
-                    mvp_weight_sum = sum(weight for (pid, weight) in mvp_attributes.values() if player.player_id == pid)
-
+                for player, mvp_weight_sum in zip(game_players_to_insert, mvp_scores):
                     if current_mvp[1] < mvp_weight_sum:
                         current_mvp = (player.player_id, mvp_weight_sum)
                     elif current_mvp[1] == mvp_weight_sum:
@@ -1334,12 +1349,10 @@ def simulate_game_mode_games(game_type: GameMode, ref_players_ids: List[int], en
                         if better_stats_count > len(STAT_ATTRS) / 2:
                             current_mvp = (player.player_id, mvp_weight_sum)
 
-                for player in game_players_to_insert:
+                for player, lvp_weight_sum in zip(game_players_to_insert, lvp_scores):
                     if player.player_id == current_mvp[0]:
                         continue
 
-                    lvp_weight_sum = sum(weight for (pid, weight) in lvp_attributes.values() if player.player_id == pid)
-
                     if current_lvp[1] < lvp_weight_sum:
                         current_lvp = (player.player_id, lvp_weight_sum)
                     elif current_lvp[1] == lvp_weight_sum:
@@ -1385,8 +1398,9 @@ def simulate_game_mode_games(game_type: GameMode, ref_players_ids: List[int], en
                         gp.ts_volatility_after = rating.sigma
 
                 game_type_stats_by_player_id = {p.player_id: p for p in party_players_stats + game_players_stats}
+                opponent_stats = np.array([opponent_stat_row(p) for p in game_players_to_insert], dtype=np.float64)
 
-                for game_player in game_players_to_insert:
+                for row, game_player in enumerate(game_players_to_insert):
                     is_mvp = bool(game_player.player_id == current_mvp[0])
                     is_lvp = bool(game_player.player_id == current_lvp[0])
                     player_stats = get_stat_parameters(game_type, game_player.true_rating_before_game)
@@ -1395,10 +1409,11 @@ def simulate_game_mode_games(game_type: GameMode, ref_players_ids: List[int], en
 
                     for calculated_stat, val in player_stats_calculated.items():
                         setattr(game_player, calculated_stat, val)
+                    opponent_stats[row] = opponent_stat_row(game_player) # In step with the attributes just set; later players' rows are refreshed on their own turn
 
-                    game_player.true_rating_after_game, game_player.elo_after, game_player.glicko_rating_after, game_player.glicko_rd_after = calculate_game_player_rating(game_type, game_player, game_player_game_type_stats, player_stats, team_elo, team_glicko, game_players_to_insert)
+                    game_player.true_rating_after_game, game_player.elo_after, game_player.glicko_rating_after, game_player.glicko_rd_after = calculate_game_player_rating(game_type, game_player, game_player_game_type_stats, player_stats, team_elo, team_glicko, game_players_to_insert, opponent_stats, row)
                 
-                logger.info(f"Inserting {len(game_players_to_insert)} game player records for game {game_number} in mode {game_type.type} in bulk...")
+                logger.info("Inserting %d game player records for game %d in mode %s in bulk...", len(game_players_to_insert), game_number, game_type.type)
                 session.add_all(game_players_to_insert)
                 logger.info("Game player records inserted.")
                 
@@ -1407,7 +1422,7 @@ def simulate_game_mode_games(game_type: GameMode, ref_players_ids: List[int], en
                     p_stats = game_type_stats_by_player_id[game_player.player_id] 
                     update_player_game_type_stats(p_stats, game_player)
                 session.commit()
-                logger.info(f"Player stats updated for game {game_number}.")
+                logger.info("Player stats updated for game %d.", game_number)
                 game_number += 1
         total_games_number += 1
 
@@ -1431,16 +1446,18 @@ def simulate_all_modes() -> None:
     
         session.add_all(players_to_create)
         session.commit()
-        logger.info(f"Created {len(players_to_create)} players.")
+        logger.info("Created %d players.", len(players_to_create))
 
-        for game_type in GAME_TYPES:
-            logger.info(f"Creating {game_type.type} stats for players")
+        for type_name in GAME_TYPE_NAMES:
+            game_type = get_game_mode(type_name)
+            logger.info("Creating %s stats for players", game_type.type)
             simulate_player_game_type_stats(game_type, ref_players_ids)
-            logger.info(f"{game_type.type} stats for players finished!")
+            logger.info("%s stats for players finished!", game_type.type)
     else:
         logger.info("Players already created")
     
-    for game_type in GAME_TYPES:
+    for type_name in GAME_TYPE_NAMES:
+        game_type = get_game_mode(type_name)
         if game_type.type in ['BR_1V99', 'BR_4V96']:
             draw_probability = 0
         else:
@@ -1452,6 +1469,6 @@ def simulate_all_modes() -> None:
           tau = BASE_TAU,
           draw_probability = draw_probability
         )
-        logger.info(f"Starting simulation for game type: {game_type.type}")
+        logger.info("Starting simulation for game type: %s", game_type.type)
         simulate_game_mode_games(game_type, ref_players_ids, env)
-        logger.info(f"Completed simulation for game type: {game_type.type}")
+        logger.info("Completed simulation for game type: %s", game_type.type)
@@ -1399,7 +1399,7 @@ def simulate_game_mode_games(game_type: GameMode, ref_players_ids: List[int], en
 
                     game_player.true_rating_after_game, game_player.elo_after, game_player.glicko_rating_after, game_player.glicko_rd_after = calculate_game_player_rating(game_type, game_player, game_player_game_type_stats, player_stats, team_elo, team_glicko, game_players_to_insert)
                 
-                logger.info(f"Inserting {len(game_players_to_insert)} game player records for game {game_number} in mode {game_type.type} in bulk...")
+                logger.info("Inserting %d game player records for game %d in mode %s in bulk...", len(game_players_to_insert), game_number, game_type.type)
                 session.add_all(game_players_to_insert)
                 logger.info("Game player records inserted.")
                 
@@ -1408,7 +1408,7 @@ def simulate_game_mode_games(game_type: GameMode, ref_players_ids: List[int], en
                     p_stats = game_type_stats_by_player_id[game_player.player_id] 
                     update_player_game_type_stats(p_stats, game_player)
                 session.commit()
-                logger.info(f"Player stats updated for game {game_number}.")
+                logger.info("Player stats updated for game %d.", game_number)
                 game_number += 1
         total_games_number += 1
 
@@ -1432,12 +1432,12 @@ def simulate_all_modes() -> None:
     
         session.add_all(players_to_create)
         session.commit()
-        logger.info(f"Created {len(players_to_create)} players.")
+        logger.info("Created %d players.", len(players_to_create))
 
         for game_type in GAME_TYPES:
-            logger.info(f"Creating {game_type.type} stats for players")
+            logger.info("Creating %s stats for players", game_type.type)
             simulate_player_game_type_stats(game_type, ref_players_ids)
-            logger.info(f"{game_type.type} stats for players finished!")
+            logger.info("%s stats for players finished!", game_type.type)
     else:
         logger.info("Players already created")
     
@@ -1453,6 +1453,6 @@ def simulate_all_modes() -> None:
           tau = BASE_TAU,
           draw_probability = draw_probability
         )
-        logger.info(f"Starting simulation for game type: {game_type.type}")
+        logger.info("Starting simulation for game type: %s", game_type.type)
         simulate_game_mode_games(game_type, ref_players_ids, env)
-        logger.info(f"Completed simulation for game type: {game_type.type}")
+        logger.info("Completed simulation for game type: %s", game_type.type)